@@ -3,13 +3,14 @@
 
 import os
 import sys
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from bleeping_scanner.rss_scanner import RSSScanner
+from bleeping_scanner.rss_scanner import Article, RSSScanner
 from bleeping_scanner.web_scraper import WebScraper
 from bleeping_scanner.discord_poster import DiscordPoster
 from bleeping_scanner.state_manager import StateManager
@@ -45,7 +46,110 @@ def get_discord_webhook() -> Optional[str]:
     return webhook
 
 
-def main() -> int:
+async def scrape_and_post(
+    scraper: WebScraper,
+    poster: DiscordPoster,
+    state_manager: StateManager,
+    articles: List[Article],
+    max_concurrency: int = 10,
+    batch_timeout: float = 2.0
+) -> Tuple[int, int]:
+    """
+    Scrape articles concurrently and post them while scraping continues.
+
+    Scraped articles are queued in feed order. A single poster drains the
+    queue and sends a webhook message whenever a full batch is ready or no
+    article has arrived for batch_timeout seconds.
+
+    Args:
+        scraper: Web scraper instance
+        poster: Discord poster instance
+        state_manager: State manager to record posted articles
+        articles: Articles to process, in feed order
+        max_concurrency: Maximum number of pages fetched at once
+        batch_timeout: Seconds to wait for more articles before posting a partial batch
+
+    Returns:
+        Tuple of (posted count, failed count)
+    """
+    logger = logging.getLogger(__name__)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    queue: asyncio.Queue = asyncio.Queue()
+    batch_size = DiscordPoster.MAX_EMBEDS_PER_MESSAGE
+
+    async def scrape(article: Article) -> Dict:
+        async with semaphore:
+            try:
+                return await scraper.scrape_article(article.link)
+            except Exception:
+                # Post without scraped details rather than abort the scan
+                logger.exception("Unexpected error scraping article: %s", article.link)
+                return {}
+
+    async def produce() -> None:
+        tasks = [asyncio.create_task(scrape(article)) for article in articles]
+        try:
+            # Await in feed order so posts keep the feed's ordering
+            for article, task in zip(articles, tasks):
+                await queue.put((article, await task))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await queue.put(None)
+
+    async def post(batch: List[Tuple[Article, Dict]]) -> int:
+        # The poster is blocking, so keep it off the event loop
+        results = await asyncio.to_thread(poster.post_articles, batch)
+
+        posted = 0
+        for (article, _), success in zip(batch, results):
+            if success:
+                state_manager.mark_posted(article.id)
+                posted += 1
+            else:
+                logger.error("Failed to post article: %s", article.title)
+        return posted
+
+    async def consume() -> int:
+        posted = 0
+        batch: List[Tuple[Article, Dict]] = []
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=batch_timeout)
+            except asyncio.TimeoutError:
+                if batch:
+                    posted += await post(batch)
+                    batch = []
+                continue
+
+            if item is None:
+                break
+            batch.append(item)
+            if len(batch) == batch_size:
+                posted += await post(batch)
+                batch = []
+
+        if batch:
+            posted += await post(batch)
+        return posted
+
+    try:
+        # Let the consumer finish posting (and marking) what was queued
+        # even if the producer fails, so the caller's flush sees it
+        results = await asyncio.gather(produce(), consume(), return_exceptions=True)
+    finally:
+        await scraper.close()
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    posted_count = results[1]
+
+    return posted_count, len(articles) - posted_count
+
+
+async def main_async() -> int:
     """
     Main execution function.
 
@@ -85,30 +189,30 @@ def main() -> int:
         logger.info("No new articles to post")
         return 0
 
-    # Process new articles
-    posted_count = 0
-    failed_count = 0
-
-    for article in new_articles:
-        logger.info(f"Processing: {article['title']}")
+    # Scrape and post new articles
+    logger.info("Processing %s new articles", len(new_articles))
+    try:
+        posted_count, failed_count = await scrape_and_post(
+            scraper, poster, state_manager, new_articles
+        )
+    finally:
+        # Persist everything posted so far in a single write
+        state_manager.flush()
 
-        # Scrape additional details
-        scraped_data = scraper.scrape_article(article['link'])
+    # Summary
+    logger.info("Scan complete: %s posted, %s failed", posted_count, failed_count)
 
-        # Post to Discord
-        success = poster.post_article(article, scraped_data)
+    return 0 if failed_count == 0 else 1
 
-        if success:
-            state_manager.mark_posted(article['id'])
-            posted_count += 1
-        else:
-            failed_count += 1
-            logger.error(f"Failed to post article: {article['title']}")
 
-    # Summary
-    logger.info(f"Scan complete: {posted_count} posted, {failed_count} failed")
+def main() -> int:
+    """
+    Run the scanner on a fresh event loop.
 
-    return 0 if failed_count == 0 else 1
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    return asyncio.run(main_async())
 
 
 if __name__ == '__main__':
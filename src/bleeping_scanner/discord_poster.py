@@ -1,16 +1,39 @@
 """Discord webhook poster for BleepingComputer articles."""
 
+import collections
+import functools
+import time
 import requests
-from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+from dateutil import parser
+from typing import Deque, Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
+from .rss_scanner import Article
+
 logger = logging.getLogger(__name__)
 
 
 class DiscordPoster:
     """Posts formatted articles to Discord via webhook."""
 
+    # Discord accepts at most 10 embeds per webhook message
+    MAX_EMBEDS_PER_MESSAGE = 10
+
+    # Discord rejects messages whose embeds total more characters than this
+    MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+    # Client-side limit matching Discord's per-webhook rate limit
+    RATE_LIMIT_REQUESTS = 5
+    RATE_LIMIT_WINDOW = 5.0
+
+    # (connect, read) timeouts in seconds, so a slow handshake cannot
+    # consume the whole budget
+    REQUEST_TIMEOUT = (3.05, 7)
+
     def __init__(self, webhook_url: str):
         """
         Initialize the Discord poster.
@@ -20,7 +43,32 @@ class DiscordPoster:
         """
         self.webhook_url = webhook_url
 
-    def post_article(self, article: Dict, scraped_data: Optional[Dict] = None) -> bool:
+        # Reuse one keep-alive connection to discord.com across posts
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=10,
+            # Only retry POSTs that Discord answered with a server error.
+            # A read error may mean the message was already delivered, and
+            # 429 is left to _send so retries go through the rate limiter
+            # (urllib3 would otherwise retry any 429 carrying Retry-After).
+            max_retries=Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=['POST'],
+                respect_retry_after_header=False,
+                # Hand the last response back so _send can handle it
+                raise_on_status=False
+            )
+        ))
+
+        # Monotonic send times within the current rate limit window
+        self._sent: Deque[float] = collections.deque()
+
+    def post_article(self, article: Article, scraped_data: Optional[Dict] = None) -> bool:
         """
         Post an article to Discord.
 
@@ -31,27 +79,154 @@ class DiscordPoster:
         Returns:
             True if posted successfully, False otherwise
         """
-        try:
+        return self.post_articles([(article, scraped_data)])[0]
+
+    def post_articles(self, batch: List[Tuple[Article, Optional[Dict]]]) -> List[bool]:
+        """
+        Post articles, packing several embeds into each webhook message.
+
+        A new message is started whenever another embed would exceed
+        MAX_EMBEDS_PER_MESSAGE embeds or MAX_EMBED_CHARS_PER_MESSAGE
+        characters, since Discord rejects the whole message otherwise.
+
+        Args:
+            batch: List of (article, scraped_data) pairs
+
+        Returns:
+            Success flag for each article in the batch
+        """
+        results: List[bool] = []
+        message: List[Tuple[Article, Dict]] = []
+        message_chars = 0
+
+        for article, scraped_data in batch:
             embed = self._create_embed(article, scraped_data)
+            embed_chars = self._embed_length(embed)
+
+            if message and (
+                len(message) == self.MAX_EMBEDS_PER_MESSAGE
+                or message_chars + embed_chars > self.MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                results.extend(self._post_message(message))
+                message = []
+                message_chars = 0
+
+            message.append((article, embed))
+            message_chars += embed_chars
+
+        if message:
+            results.extend(self._post_message(message))
+        return results
+
+    def _post_message(self, message: List[Tuple[Article, Dict]]) -> List[bool]:
+        """
+        Post prepared embeds as a single webhook message.
+
+        Args:
+            message: List of (article, embed) pairs
+
+        Returns:
+            Success flag for each article in the message
+        """
+        try:
             payload = {
-                'embeds': [embed]
+                'embeds': [embed for _, embed in message]
             }
 
-            response = requests.post(
+            response = self._send(payload)
+            response.raise_for_status()
+
+            for article, _ in message:
+                logger.info("Posted article to Discord: %s", article.title)
+            return [True] * len(message)
+
+        except requests.RequestException as e:
+            logger.error("Error posting to Discord: %s", e)
+            return [False] * len(message)
+
+    @staticmethod
+    def _embed_length(embed: Dict) -> int:
+        """
+        Count the characters Discord includes in its per-message embed limit.
+
+        Args:
+            embed: Discord embed dictionary
+
+        Returns:
+            Number of counted characters
+        """
+        length = len(embed.get('title') or '') + len(embed.get('description') or '')
+        length += len(embed.get('author', {}).get('name') or '')
+        length += len(embed.get('footer', {}).get('text') or '')
+        for field in embed.get('fields', []):
+            length += len(field['name']) + len(field['value'])
+        return length
+
+    def _send(self, payload: Dict) -> requests.Response:
+        """
+        Send a webhook payload, respecting Discord's rate limit.
+
+        If Discord still answers 429, wait for the advertised reset and
+        retry once.
+
+        Args:
+            payload: Webhook message payload
+
+        Returns:
+            Webhook response
+        """
+        self._wait_for_slot()
+        response = self.session.post(
+            self.webhook_url,
+            json=payload,
+            timeout=self.REQUEST_TIMEOUT
+        )
+
+        if response.status_code == 429:
+            retry_after = self._retry_after(response)
+            logger.warning("Rate limited by Discord, retrying in %.2fs", retry_after)
+            time.sleep(retry_after)
+            self._wait_for_slot()
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
-                timeout=10
+                timeout=self.REQUEST_TIMEOUT
             )
-            response.raise_for_status()
 
-            logger.info(f"Posted article to Discord: {article['title']}")
-            return True
+        return response
 
-        except requests.RequestException as e:
-            logger.error(f"Error posting to Discord: {e}")
-            return False
+    def _wait_for_slot(self) -> None:
+        """Block until another request fits in the rate limit window."""
+        while True:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= self.RATE_LIMIT_WINDOW:
+                self._sent.popleft()
+            if len(self._sent) < self.RATE_LIMIT_REQUESTS:
+                break
+            time.sleep(self.RATE_LIMIT_WINDOW - (now - self._sent[0]))
 
-    def _create_embed(self, article: Dict, scraped_data: Optional[Dict] = None) -> Dict:
+        self._sent.append(time.monotonic())
+
+    def _retry_after(self, response: requests.Response) -> float:
+        """
+        Get the wait time advertised by a rate limited response.
+
+        Args:
+            response: Response with status 429
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        for header in ('X-RateLimit-Reset-After', 'Retry-After'):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    return float(value)
+                except ValueError:
+                    continue
+        return self.RATE_LIMIT_WINDOW
+
+    def _create_embed(self, article: Article, scraped_data: Optional[Dict] = None) -> Dict:
         """
         Create a Discord embed for the article.
 
@@ -65,22 +240,22 @@ class DiscordPoster:
         scraped_data = scraped_data or {}
 
         # Build description
-        description = scraped_data.get('description') or article.get('summary', '')
-        # Strip HTML tags from summary if present
+        description = scraped_data.get('description') or article.summary
         if description:
-            from bs4 import BeautifulSoup
-            description = BeautifulSoup(description, 'html.parser').get_text()
+            # Strip HTML tags and entities only if the summary contains any
+            if '<' in description or '&' in description:
+                description = BeautifulSoup(description, 'lxml').get_text()
             # Limit to 300 characters for clean formatting
             if len(description) > 300:
                 description = description[:297] + '...'
 
         # Parse published date
-        timestamp = self._parse_timestamp(article.get('published'))
+        timestamp = self._parse_timestamp(article.published)
 
         # Build embed
         embed = {
-            'title': article['title'],
-            'url': article['link'],
+            'title': article.title,
+            'url': article.link,
             'description': description,
             'color': 0xE74C3C,  # BleepingComputer red
             'timestamp': timestamp,
@@ -89,7 +264,7 @@ class DiscordPoster:
                 'icon_url': 'https://www.bleepstatic.com/favicon/apple-icon-60x60.png'
             },
             'author': {
-                'name': article.get('author', 'BleepingComputer'),
+                'name': article.author,
             }
         }
 
@@ -121,10 +296,15 @@ class DiscordPoster:
         Returns:
             ISO 8601 formatted timestamp or None
         """
+        return self._parse_ts_cached(published)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_ts_cached(published: str) -> Optional[str]:
+        """Parse a published date string, memoized since dateutil is slow."""
         try:
-            from dateutil import parser
             dt = parser.parse(published)
             return dt.isoformat()
         except Exception as e:
-            logger.warning(f"Could not parse timestamp '{published}': {e}")
+            logger.warning("Could not parse timestamp '%s': %s", published, e)
             return None
@@ -1,6 +1,9 @@
 """RSS feed scanner for BleepingComputer."""
 
+import re
 import feedparser
+import requests
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
 import logging
@@ -8,44 +11,77 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Article:
+    """An article parsed from the RSS feed."""
+
+    title: str
+    link: str
+    published: str
+    summary: str
+    author: str
+    id: str
+    published_parsed: Optional[tuple] = None
+
+
 class RSSScanner:
     """Scans BleepingComputer RSS feed for new articles."""
 
     RSS_FEED_URL = "https://www.bleepingcomputer.com/feed/"
 
-    def __init__(self):
-        """Initialize the RSS scanner."""
+    # Common indicators of sponsored content
+    _SPONSORED_RE = re.compile(
+        r'sponsored|advertisement|promoted|\[ad\]|\(ad\)|partner content',
+        re.IGNORECASE
+    )
+    _SPONSORED_TAG_RE = re.compile(r'sponsored|advertisement', re.IGNORECASE)
+
+    def __init__(self, timeout: int = 10):
+        """
+        Initialize the RSS scanner.
+
+        Args:
+            timeout: Request timeout in seconds
+        """
         self.feed_url = self.RSS_FEED_URL
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': feedparser.USER_AGENT
+        })
 
-    def fetch_articles(self) -> List[Dict]:
+    def fetch_articles(self) -> List[Article]:
         """
         Fetch articles from the RSS feed.
 
         Returns:
-            List of article dictionaries with title, link, published date, etc.
+            List of articles with title, link, published date, etc.
         """
         try:
-            logger.info(f"Fetching RSS feed from {self.feed_url}")
-            feed = feedparser.parse(self.feed_url)
+            logger.info("Fetching RSS feed from %s", self.feed_url)
+            response = self.session.get(self.feed_url, timeout=self.timeout)
+            response.raise_for_status()
+
+            feed = feedparser.parse(response.content)
 
             if feed.bozo:
-                logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
+                logger.warning("Feed parsing warning: %s", feed.bozo_exception)
 
             articles = []
             for entry in feed.entries:
                 # Filter out sponsored/ad posts
                 if self._is_sponsored(entry):
-                    logger.info(f"Skipping sponsored post: {entry.get('title', 'Unknown')}")
+                    logger.info("Skipping sponsored post: %s", entry.get('title', 'Unknown'))
                     continue
 
                 article = self._parse_entry(entry)
                 articles.append(article)
 
-            logger.info(f"Fetched {len(articles)} articles (filtered out sponsored content)")
+            logger.info("Fetched %s articles (filtered out sponsored content)", len(articles))
             return articles
 
         except Exception as e:
-            logger.error(f"Error fetching RSS feed: {e}")
+            logger.error("Error fetching RSS feed: %s", e)
             return []
 
     def _is_sponsored(self, entry: Dict) -> bool:
@@ -58,48 +94,35 @@ class RSSScanner:
         Returns:
             True if sponsored, False otherwise
         """
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-
-        # Common indicators of sponsored content
-        sponsored_keywords = [
-            'sponsored',
-            'advertisement',
-            'promoted',
-            '[ad]',
-            '(ad)',
-            'partner content'
-        ]
-
-        for keyword in sponsored_keywords:
-            if keyword in title or keyword in summary:
-                return True
+        # Newline-joined so a match cannot span the title/summary boundary
+        text = f"{entry.get('title', '')}\n{entry.get('summary', '')}"
+        if self._SPONSORED_RE.search(text):
+            return True
 
         # Check tags/categories
         tags = entry.get('tags', [])
         for tag in tags:
-            tag_term = tag.get('term', '').lower()
-            if 'sponsored' in tag_term or 'advertisement' in tag_term:
+            if self._SPONSORED_TAG_RE.search(tag.get('term', '')):
                 return True
 
         return False
 
-    def _parse_entry(self, entry: Dict) -> Dict:
+    def _parse_entry(self, entry: Dict) -> Article:
         """
-        Parse an RSS entry into a structured article dictionary.
+        Parse an RSS entry into a structured article.
 
         Args:
             entry: RSS feed entry
 
         Returns:
-            Parsed article dictionary
+            Parsed article
         """
-        return {
-            'title': entry.get('title', 'No Title'),
-            'link': entry.get('link', ''),
-            'published': entry.get('published', ''),
-            'published_parsed': entry.get('published_parsed'),
-            'summary': entry.get('summary', ''),
-            'author': entry.get('author', 'BleepingComputer'),
-            'id': entry.get('id', entry.get('link', '')),
-        }
+        return Article(
+            title=entry.get('title', 'No Title'),
+            link=entry.get('link', ''),
+            published=entry.get('published', ''),
+            published_parsed=entry.get('published_parsed'),
+            summary=entry.get('summary', ''),
+            author=entry.get('author', 'BleepingComputer'),
+            id=entry.get('id', entry.get('link', '')),
+        )
@@ -2,16 +2,39 @@
 
 import json
 import os
+import time
 from typing import Set, Dict
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(data: bytes) -> Dict:
+    """Deserialize JSON with orjson when installed, else the json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Dict) -> bytes:
+    """Serialize JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
 class StateManager:
     """Manages state to prevent duplicate posts."""
 
+    # How long a cached "posted at" timestamp may be reused, in seconds
+    TIMESTAMP_TTL = 60
+
     def __init__(self, state_file: str = 'posted_articles.json', retention_days: int = 30):
         """
         Initialize the state manager.
@@ -23,43 +46,71 @@ class StateManager:
         self.state_file = state_file
         self.retention_days = retention_days
         self.state = self._load_state()
+        self._dirty = False
+        self._now = int(time.time())
+        self._now_checked = time.monotonic()
+        # Prune once per run rather than on every save
+        self._cleanup_old_entries()
 
-    def _load_state(self) -> Dict[str, str]:
+    def _load_state(self) -> Dict[str, int]:
         """
         Load state from file.
 
+        Older state files stored ISO 8601 strings; those are converted to
+        epoch seconds on load.
+
         Returns:
-            Dictionary mapping article IDs to posted timestamps
+            Dictionary mapping article IDs to posted epoch timestamps
         """
         if not os.path.exists(self.state_file):
-            logger.info(f"State file not found, starting fresh")
+            logger.info("State file not found, starting fresh")
             return {}
 
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
-                logger.info(f"Loaded state with {len(state)} articles")
-                return state
+            with open(self.state_file, 'rb') as f:
+                state = _loads(f.read())
+                logger.info("Loaded state with %s articles", len(state))
         except Exception as e:
-            logger.error(f"Error loading state file: {e}")
+            logger.error("Error loading state file: %s", e)
+            return {}
+
+        if not isinstance(state, dict):
+            logger.error("Error loading state file: expected an object, got %s", type(state).__name__)
             return {}
 
+        migrated = {}
+        for article_id, timestamp in state.items():
+            if isinstance(timestamp, str):
+                try:
+                    timestamp = int(datetime.fromisoformat(timestamp).timestamp())
+                except ValueError as e:
+                    logger.warning("Dropping state entry %s with bad timestamp: %s", article_id, e)
+                    continue
+            elif not isinstance(timestamp, (int, float)) or isinstance(timestamp, bool):
+                logger.warning("Dropping state entry %s with bad timestamp: %r", article_id, timestamp)
+                continue
+            migrated[article_id] = int(timestamp)
+        return migrated
+
     def _save_state(self) -> None:
-        """Save state to file."""
-        try:
-            # Clean old entries before saving
-            self._cleanup_old_entries()
+        """
+        Save state to file.
 
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
-                logger.info(f"Saved state with {len(self.state)} articles")
+        Writes to a temporary file and swaps it into place, so a crash
+        mid-write never leaves a truncated state file behind.
+        """
+        try:
+            tmp_file = self.state_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.state))
+            os.replace(tmp_file, self.state_file)
+            logger.info("Saved state with %s articles", len(self.state))
         except Exception as e:
-            logger.error(f"Error saving state file: {e}")
+            logger.error("Error saving state file: %s", e)
 
     def _cleanup_old_entries(self) -> None:
         """Remove entries older than retention_days."""
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-        cutoff_timestamp = cutoff_date.isoformat()
+        cutoff_timestamp = int(time.time()) - self.retention_days * 86400
 
         old_count = len(self.state)
         self.state = {
@@ -70,7 +121,22 @@ class StateManager:
 
         removed = old_count - len(self.state)
         if removed > 0:
-            logger.info(f"Cleaned up {removed} old entries from state")
+            logger.info("Cleaned up %s old entries from state", removed)
+
+    def _timestamp(self) -> int:
+        """
+        Get the current time for a state entry.
+
+        The value is cached for TIMESTAMP_TTL seconds, which is far finer
+        than the day-level retention it feeds.
+
+        Returns:
+            Epoch seconds
+        """
+        if time.monotonic() - self._now_checked > self.TIMESTAMP_TTL:
+            self._now = int(time.time())
+            self._now_checked = time.monotonic()
+        return self._now
 
     def is_posted(self, article_id: str) -> bool:
         """
@@ -88,26 +154,37 @@ class StateManager:
         """
         Mark an article as posted.
 
+        Changes are kept in memory until flush() is called.
+
         Args:
             article_id: Unique article identifier
         """
-        self.state[article_id] = datetime.now().isoformat()
-        self._save_state()
+        self.state[article_id] = self._timestamp()
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending changes to the state file."""
+        if self._dirty:
+            self._save_state()
+            self._dirty = False
 
     def get_new_articles(self, articles: list) -> list:
         """
         Filter out articles that have already been posted.
 
         Args:
-            articles: List of article dictionaries
+            articles: List of articles
 
         Returns:
             List of new articles not yet posted
         """
+        # Dict key lookups are already hash-set lookups; bind the dict locally
+        # to skip a method call per article
+        posted = self.state
         new_articles = [
             article for article in articles
-            if not self.is_posted(article['id'])
+            if article.id not in posted
         ]
 
-        logger.info(f"Found {len(new_articles)} new articles out of {len(articles)} total")
+        logger.info("Found %s new articles out of %s total", len(new_articles), len(articles))
         return new_articles
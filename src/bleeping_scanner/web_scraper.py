@@ -1,13 +1,54 @@
 """Web scraper for extracting article details from BleepingComputer."""
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup, Tag
+from typing import Any, Dict, List, Optional
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_html(content: bytes) -> Any:
+    """Parse a page with selectolax when installed, else BeautifulSoup."""
+    if HTMLParser is not None:
+        return HTMLParser(content)
+    return BeautifulSoup(content, 'lxml')
+
+
+def _select_one(node: Any, selector: str) -> Any:
+    """Return the first node matching a CSS selector, or None."""
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _select_all(node: Any, selector: str) -> List[Any]:
+    """Return all nodes matching a CSS selector."""
+    if isinstance(node, Tag):
+        return node.select(selector)
+    return node.css(selector)
+
+
+def _attr(node: Any, name: str) -> Optional[str]:
+    """Return an attribute value of a node."""
+    if isinstance(node, Tag):
+        return node.get(name)
+    return node.attributes.get(name)
+
+
+def _text(node: Any) -> str:
+    """Return the text content of a node."""
+    if isinstance(node, Tag):
+        return node.get_text()
+    return node.text()
+
+
 class WebScraper:
     """Scrapes article pages for additional details."""
 
@@ -19,12 +60,34 @@ class WebScraper:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        }
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        The session must be created inside a running event loop, so it is
+        opened lazily and reused for every article in the scan.
 
-    def scrape_article(self, url: str) -> Dict[str, Optional[str]]:
+        Returns:
+            Shared aiohttp client session
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def scrape_article(self, url: str) -> Dict[str, Optional[str]]:
         """
         Scrape article page for additional details.
 
@@ -35,80 +98,81 @@ class WebScraper:
             Dictionary with scraped details (description, image_url, category)
         """
         try:
-            logger.info(f"Scraping article: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            logger.info("Scraping article: %s", url)
+            async with self._get_session().get(url) as response:
+                response.raise_for_status()
+                content = await response.read()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = _parse_html(content)
 
             return {
-                'description': self._extract_description(soup),
-                'image_url': self._extract_image(soup),
-                'category': self._extract_category(soup),
+                'description': self._extract_description(tree),
+                'image_url': self._extract_image(tree),
+                'category': self._extract_category(tree),
             }
 
-        except requests.RequestException as e:
-            logger.error(f"Error scraping article {url}: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Error scraping article %s: %s", url, e)
             return {
                 'description': None,
                 'image_url': None,
                 'category': None,
             }
 
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_description(self, tree: Any) -> Optional[str]:
         """Extract article description/excerpt."""
         # Try meta description first
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content'].strip()
+        meta_desc = _select_one(tree, 'meta[name="description"]')
+        if meta_desc and _attr(meta_desc, 'content'):
+            return _attr(meta_desc, 'content').strip()
 
         # Try Open Graph description
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            return og_desc['content'].strip()
+        og_desc = _select_one(tree, 'meta[property="og:description"]')
+        if og_desc and _attr(og_desc, 'content'):
+            return _attr(og_desc, 'content').strip()
 
         # Try first paragraph of article content
-        article = soup.find('div', class_='articleBody')
+        article = _select_one(tree, 'div.articleBody')
         if article:
-            first_p = article.find('p')
+            first_p = _select_one(article, 'p')
             if first_p:
-                text = first_p.get_text().strip()
+                text = _text(first_p).strip()
                 # Limit length
                 return text[:300] + '...' if len(text) > 300 else text
 
         return None
 
-    def _extract_image(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_image(self, tree: Any) -> Optional[str]:
         """Extract article featured image URL."""
         # Try Open Graph image
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            return og_image['content']
+        og_image = _select_one(tree, 'meta[property="og:image"]')
+        if og_image and _attr(og_image, 'content'):
+            return _attr(og_image, 'content')
 
         # Try Twitter card image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-        if twitter_image and twitter_image.get('content'):
-            return twitter_image['content']
+        twitter_image = _select_one(tree, 'meta[name="twitter:image"]')
+        if twitter_image and _attr(twitter_image, 'content'):
+            return _attr(twitter_image, 'content')
 
         # Try article header image
-        article_img = soup.find('img', class_='article_header_img')
-        if article_img and article_img.get('src'):
-            return article_img['src']
+        article_img = _select_one(tree, 'img.article_header_img')
+        if article_img and _attr(article_img, 'src'):
+            return _attr(article_img, 'src')
 
         return None
 
-    def _extract_category(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_category(self, tree: Any) -> Optional[str]:
         """Extract article category."""
         # Try breadcrumb navigation
-        breadcrumb = soup.find('div', class_='breadcrumbs')
+        breadcrumb = _select_one(tree, 'div.breadcrumbs')
         if breadcrumb:
-            links = breadcrumb.find_all('a')
+            links = _select_all(breadcrumb, 'a')
             if len(links) > 1:
-                return links[-1].get_text().strip()
+                return _text(links[-1]).strip()
 
         # Try category meta tag
-        category_meta = soup.find('meta', property='article:section')
-        if category_meta and category_meta.get('content'):
-            return category_meta['content']
+        category_meta = _select_one(tree, 'meta[property="article:section"]')
+        if category_meta and _attr(category_meta, 'content'):
+            return _attr(category_meta, 'content')
 
         return None